@@ -15,6 +15,38 @@ from src.categorizer import TransactionCategorizer
 from src.analyzer import FinanceAnalyzer
 from src.csv_import import CSVImporter
 
+# Column layout for transaction listings: ID, Date, Description, Amount, Category, Type
+TRANSACTION_ROW = "{:<5} {:<12} {:<30} {:<12} {:<20} {:<10}"
+
+# Largest span accepted for an ID range like 10-14 when deleting
+MAX_DELETE_RANGE = 1000
+
+# Confirmation prompts list the IDs only for selections up to this size
+MAX_LISTED_IDS = 10
+
+
+def parse_id_list(text: str) -> list:
+    # Parse "1,3,5" / "1-5" style input into a list of unique IDs
+    # Raises ValueError for malformed, reversed or oversized ranges
+    trans_ids = []
+    for part in text.split(','):
+        part = part.strip()
+        if not part:
+            # Tolerate stray commas such as "1,2,"
+            continue
+        if '-' in part:
+            first, last = (int(bound) for bound in part.split('-', 1))
+            if first > last or last - first >= MAX_DELETE_RANGE:
+                raise ValueError(f"Invalid range: {part}")
+            trans_ids.extend(range(first, last + 1))
+        else:
+            trans_ids.append(int(part))
+    
+    if not trans_ids:
+        raise ValueError("No transaction IDs given")
+    
+    return list(dict.fromkeys(trans_ids))
+
 
 class FinanceTrackerApp:
     # Main application class
@@ -52,7 +84,7 @@ class FinanceTrackerApp:
         # Get date
         date_input = input("Date (YYYY-MM-DD) or press Enter for today: ").strip()
         if not date_input:
-            date = datetime.now().strftime('%Y-%m-%d')
+            date = datetime.now().date().isoformat()
         else:
             date = date_input
         
@@ -107,48 +139,72 @@ class FinanceTrackerApp:
         
         period = input("Period (1=Last 7 days, 2=Last 30 days, 3=This month, 4=Custom): ")
         
-        today = datetime.now()
+        # Format today's date once; isoformat() is much cheaper than strftime()
+        today = datetime.now().date()
+        today_str = today.isoformat()
         
         if period == '1':
-            start_date = (today - timedelta(days=7)).strftime('%Y-%m-%d')
-            end_date = today.strftime('%Y-%m-%d')
+            start_date = (today - timedelta(days=7)).isoformat()
+            end_date = today_str
         elif period == '2':
-            start_date = (today - timedelta(days=30)).strftime('%Y-%m-%d')
-            end_date = today.strftime('%Y-%m-%d')
+            start_date = (today - timedelta(days=30)).isoformat()
+            end_date = today_str
         elif period == '3':
-            start_date = today.strftime('%Y-%m-01')
-            end_date = today.strftime('%Y-%m-%d')
+            start_date = today.replace(day=1).isoformat()
+            end_date = today_str
         elif period == '4':
             start_date = input("Start date (YYYY-MM-DD): ")
             end_date = input("End date (YYYY-MM-DD): ")
         else:
             return
         
-        transactions = self.db.get_transactions(start_date, end_date)
+        page_size = 200
+        offset = 0
+        transactions = self.db.get_transactions(start_date, end_date,
+                                                limit=page_size, offset=offset)
         
         if not transactions:
             print("\nNo transactions found for this period.")
             return
         
+        format_row = TRANSACTION_ROW.format
+        
         print(f"\nTransactions from {start_date} to {end_date}:")
         print("-"*100)
-        print(f"{'ID':<5} {'Date':<12} {'Description':<30} {'Amount':<12} {'Category':<20} {'Type':<10}")
+        print(format_row('ID', 'Date', 'Description', 'Amount', 'Category', 'Type'))
         print("-"*100)
         
-        total_income = 0
-        total_expense = 0
+        shown = 0
         
-        for trans in transactions:
-            trans_id, date, desc, amount, category, trans_type, _ = trans
+        while transactions:
+            # Format the whole page first and write it with a single call
+            lines = []
+            for trans in transactions:
+                trans_id, date, desc, amount, category, trans_type, _ = trans
+                
+                if trans_type == 'income':
+                    amount_str = f"+${amount:.2f}"
+                else:
+                    amount_str = f"-${amount:.2f}"
+                
+                lines.append(format_row(trans_id, date, desc[:28], amount_str, category, trans_type))
             
-            if trans_type == 'income':
-                total_income += amount
-                amount_str = f"+${amount:.2f}"
-            else:
-                total_expense += amount
-                amount_str = f"-${amount:.2f}"
+            print("\n".join(lines))
+            
+            shown += len(transactions)
+            if len(transactions) < page_size:
+                break
             
-            print(f"{trans_id:<5} {date:<12} {desc[:28]:<30} {amount_str:<12} {category:<20} {trans_type:<10}")
+            offset += page_size
+            transactions = self.db.get_transactions(start_date, end_date,
+                                                    limit=page_size, offset=offset)
+            if transactions:
+                more = input(f"\n-- Shown {shown} transactions. Next page? (y/n): ").strip().lower()
+                if more not in ['yes', 'y']:
+                    break
+        
+        # Totals cover the whole period, not just the pages that were shown
+        total_income, total_expense = self.db.get_period_totals(start_date, end_date)
         
         print("-"*100)
         print(f"Total Income:  ${total_income:.2f}")
@@ -160,22 +216,25 @@ class FinanceTrackerApp:
         print("\n--- Delete Transaction ---")
         
         # First, show recent transactions
-        today = datetime.now()
-        start_date = (today - timedelta(days=30)).strftime('%Y-%m-%d')
-        end_date = today.strftime('%Y-%m-%d')
+        today = datetime.now().date()
+        start_date = (today - timedelta(days=30)).isoformat()
+        end_date = today.isoformat()
         
-        transactions = self.db.get_transactions(start_date, end_date)
+        transactions = self.db.get_transactions(start_date, end_date, limit=20)
         
         if not transactions:
             print("\nNo recent transactions found.")
             return
         
+        format_row = TRANSACTION_ROW.format
+        
         print(f"\nRecent Transactions (last 30 days):")
         print("-"*100)
-        print(f"{'ID':<5} {'Date':<12} {'Description':<30} {'Amount':<12} {'Category':<20} {'Type':<10}")
+        print(format_row('ID', 'Date', 'Description', 'Amount', 'Category', 'Type'))
         print("-"*100)
         
-        for trans in transactions[:20]:  
+        lines = []
+        for trans in transactions:
             trans_id, date, desc, amount, category, trans_type, _ = trans
             
             if trans_type == 'income':
@@ -183,30 +242,39 @@ class FinanceTrackerApp:
             else:
                 amount_str = f"-${amount:.2f}"
             
-            print(f"{trans_id:<5} {date:<12} {desc[:28]:<30} {amount_str:<12} {category:<20} {trans_type:<10}")
+            lines.append(format_row(trans_id, date, desc[:28], amount_str, category, trans_type))
         
+        print("\n".join(lines))
         print("-"*100)
         
-        # Get transaction ID to delete
+        # Get transaction IDs to delete, e.g. "7", "1,3,5" or "10-14"
         try:
-            trans_id = input("\nEnter transaction ID to delete (or 'cancel' to go back): ").strip()
+            id_input = input("\nEnter transaction ID(s) to delete, e.g. 7, 1,3,5 or 10-14 (or 'cancel' to go back): ").strip()
             
-            if trans_id.lower() == 'cancel':
+            if id_input.lower() == 'cancel':
                 return
             
-            trans_id = int(trans_id)
+            trans_ids = parse_id_list(id_input)
             
-            # Confirm deletion
-            confirm = input(f"Are you sure you want to delete transaction #{trans_id}? (yes/no): ").strip().lower()
+            # Confirm deletion; large selections only show a count
+            if len(trans_ids) == 1:
+                prompt = f"Are you sure you want to delete transaction #{trans_ids[0]}? (yes/no): "
+            elif len(trans_ids) <= MAX_LISTED_IDS:
+                id_list = ", ".join(f"#{trans_id}" for trans_id in trans_ids)
+                prompt = f"Are you sure you want to delete {len(trans_ids)} transactions ({id_list})? (yes/no): "
+            else:
+                prompt = f"Are you sure you want to delete {len(trans_ids)} transactions? (yes/no): "
+            confirm = input(prompt).strip().lower()
             
             if confirm in ['yes', 'y']:
-                self.db.delete_transaction(trans_id)
-                print(f"\n✓ Transaction #{trans_id} deleted successfully!")
+                deleted = self.db.delete_transactions(trans_ids)
+                print(f"\n✓ Deleted {deleted} transaction(s) successfully!")
             else:
                 print("\nDeletion cancelled.")
         
         except ValueError:
-            print("\nInvalid transaction ID. Please enter a number.")
+            print("\nInvalid transaction ID. Use numbers, commas and ranges like 1-5 "
+                  f"(at most {MAX_DELETE_RANGE} IDs per range).")
         except Exception as e:
             print(f"\nError deleting transaction: {e}")
     
@@ -226,7 +294,8 @@ class FinanceTrackerApp:
             today = datetime.now()
             year, month = today.year, today.month
         
-        summary = self.db.get_monthly_summary(year, month)
+        month_report = self.analyzer.get_month_report(year, month)
+        summary = month_report.summary
         
         print(f"\nSummary for {year}-{month:02d}:")
         print("-"*50)
@@ -235,20 +304,17 @@ class FinanceTrackerApp:
         print(f"Balance:         ${summary['balance']:,.2f}")
         
         # Show spending by category
-        start_date = f"{year}-{month:02d}-01"
-        if month == 12:
-            end_date = f"{year+1}-01-01"
-        else:
-            end_date = f"{year}-{month+1:02d}-01"
-        
-        category_data = self.db.get_category_spending(start_date, end_date)
+        category_data = month_report.category_data
         
         if category_data:
             print("\nSpending by Category:")
             print("-"*50)
-            for category, amount in category_data:
-                percentage = (amount / summary['expenses'] * 100) if summary['expenses'] > 0 else 0
-                print(f"{category:<30} ${amount:>8,.2f} ({percentage:>5.1f}%)")
+            # Work out the percentage scale once instead of per category
+            scale = 100 / summary['expenses'] if summary['expenses'] > 0 else 0
+            print("\n".join(
+                f"{category:<30} ${amount:>8,.2f} ({amount * scale:>5.1f}%)"
+                for category, amount in category_data
+            ))
     
     def check_budget_alerts(self):
         # Check for budget warnings
@@ -281,17 +347,18 @@ class FinanceTrackerApp:
         
         choice = input("\nSelect report type: ")
         
-        today = datetime.now()
+        today = datetime.now().date()
+        today_str = today.isoformat()
         
         if choice == '1':
             period = input("Period (1=This month, 2=Last 30 days, 3=Custom): ")
             
             if period == '1':
-                start_date = today.strftime('%Y-%m-01')
-                end_date = today.strftime('%Y-%m-%d')
+                start_date = today.replace(day=1).isoformat()
+                end_date = today_str
             elif period == '2':
-                start_date = (today - timedelta(days=30)).strftime('%Y-%m-%d')
-                end_date = today.strftime('%Y-%m-%d')
+                start_date = (today - timedelta(days=30)).isoformat()
+                end_date = today_str
             else:
                 start_date = input("Start date (YYYY-MM-DD): ")
                 end_date = input("End date (YYYY-MM-DD): ")
@@ -303,7 +370,8 @@ class FinanceTrackerApp:
         elif choice == '2':
             months = int(input("Number of months to display (default 6): ") or "6")
             path = self.analyzer.plot_monthly_trend(months)
-            print(f"\n✓ Report saved: {path}")
+            if path:
+                print(f"\n✓ Report saved: {path}")
         
         elif choice == '3':
             month_input = input("Month (YYYY-MM) or press Enter for current: ").strip()
@@ -352,7 +420,8 @@ class FinanceTrackerApp:
             filepath, date_col, desc_col, amount_col
         )
         
-        print(f"\n✓ Imported {count} transactions successfully!")
+        if count is not None:
+            print(f"\n✓ Imported {count} transactions successfully!")
     
     def manage_categories(self):
         # Manage budget categories
@@ -385,12 +454,11 @@ class FinanceTrackerApp:
         # Export transactions to CSV
         print("\n--- Export Data ---")
         
-        today = datetime.now()
         start_date = input("Start date (YYYY-MM-DD): ")
         end_date = input("End date (YYYY-MM-DD) or press Enter for today: ").strip()
         
         if not end_date:
-            end_date = today.strftime('%Y-%m-%d')
+            end_date = datetime.now().date().isoformat()
         
         filepath = self.analyzer.export_to_csv(start_date, end_date)
         
@@ -407,7 +475,8 @@ class FinanceTrackerApp:
         
         # Import it
         count = self.csv_importer.import_transactions(csv_path)
-        print(f"✓ Imported {count} sample transactions!")
+        if count is not None:
+            print(f"✓ Imported {count} sample transactions!")
     
     def run(self):
         # Main application loop
@@ -454,6 +523,7 @@ class FinanceTrackerApp:
                 traceback.print_exc()
         
         # Clean up
+        self.analyzer.close()
         self.db.close()
 
 
@@ -3,12 +3,38 @@ Analytics and visualization module
 Generates reports and charts from transaction data
 """
 
-import matplotlib.pyplot as plt
-import pandas as pd
-from datetime import datetime, timedelta
-from typing import List, Tuple, Optional
+import csv
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, List, Tuple, Optional, TYPE_CHECKING
 import os
 
+from .database import month_bounds
+
+# matplotlib and pandas are slow to import, so they are only loaded by the
+# methods that need them
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Charts are only ever written to files, so print-grade resolution is not needed
+CHART_DPI = 110
+
+
+def _load_pyplot():
+    # Import pyplot on the non-interactive Agg backend, skipping GUI detection
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    return plt
+
+
+@dataclass
+class MonthReport:
+    # Aggregated figures for one month, shared by the summary views and charts
+    summary: dict
+    category_data: List[Tuple[str, float]]
+    alerts: List[dict]
+
 
 class FinanceAnalyzer:
     # Analyzes and visualizes financial data
@@ -16,8 +42,82 @@ class FinanceAnalyzer:
     def __init__(self, database):
         # Initialize with database connection
         self.db = database
+        self._month_cache: Dict[Tuple[int, int], MonthReport] = {}
+        self._cache_epoch = database.write_epoch
+        self._fig = None
+    
+    def _get_figure(self, figsize: Tuple[float, float]):
+        # Reuse one cleared Figure across charts instead of building a new one each time
+        if self._fig is None:
+            plt = _load_pyplot()
+            self._fig = plt.figure(figsize=figsize)
+        else:
+            self._fig.clear()
+            self._fig.set_size_inches(figsize)
+        
+        return self._fig
+    
+    def close(self):
+        # Release the shared chart figure
+        if self._fig is not None:
+            plt = _load_pyplot()
+            plt.close(self._fig)
+            self._fig = None
+    
+    def get_month_report(self, year: int, month: int) -> MonthReport:
+        """
+        Get summary, category spending and budget alerts for a month
+        
+        Results are cached per (year, month) until the database reports a write.
+        
+        Args:
+            year: Year
+            month: Month (1-12)
+            
+        Returns:
+            MonthReport for the month
+        """
+        if self._cache_epoch != self.db.write_epoch:
+            self._month_cache.clear()
+            self._cache_epoch = self.db.write_epoch
+        
+        key = (year, month)
+        if key in self._month_cache:
+            return self._month_cache[key]
+        
+        # One grouped query feeds the summary, alerts and category spending
+        breakdown = self.db.get_month_breakdown(year, month)
+        
+        income = sum(total for _, trans_type, total in breakdown if trans_type == 'income')
+        expenses = sum(total for _, trans_type, total in breakdown if trans_type == 'expense')
+        summary = {
+            'income': income,
+            'expenses': expenses,
+            'balance': income - expenses,
+            'month': f"{year}-{month:02d}"
+        }
+        
+        category_data = [(category, total) for category, trans_type, total in breakdown
+                         if trans_type == 'expense']
+        
+        budgets = {cat[0]: cat[1] for cat in self.db.get_categories()}
+        alerts = []
+        for category, spent in category_data:
+            limit = budgets.get(category, 0)
+            if limit > 0 and spent >= limit * 0.8:
+                alerts.append({
+                    'category': category,
+                    'spent': spent,
+                    'limit': limit,
+                    'percentage': spent / limit * 100
+                })
+        alerts.sort(key=lambda alert: alert['percentage'], reverse=True)
+        
+        report = MonthReport(summary, category_data, alerts)
+        self._month_cache[key] = report
+        return report
     
-    def generate_spending_report(self, start_date: str, end_date: str) -> pd.DataFrame:
+    def generate_spending_report(self, start_date: str, end_date: str) -> 'pd.DataFrame':
         """
         Generate detailed spending report for date range
         
@@ -28,6 +128,8 @@ class FinanceAnalyzer:
         Returns:
             DataFrame with spending analysis
         """
+        import pandas as pd
+        
         transactions = self.db.get_transactions(start_date, end_date)
         
         if not transactions:
@@ -40,7 +142,7 @@ class FinanceAnalyzer:
         return df
     
     def plot_category_spending(self, start_date: str, end_date: str, 
-                              save_path: str = None) -> str:
+                              save_path: str = None, top_n: int = 10) -> str:
         """
         Create pie chart of spending by category
         
@@ -48,11 +150,14 @@ class FinanceAnalyzer:
             start_date: Start date (YYYY-MM-DD)
             end_date: End date (YYYY-MM-DD)
             save_path: Path to save the chart
+            top_n: Number of largest categories to show; the rest become 'Other'
             
         Returns:
             Path to saved chart
         """
-        category_data = self.db.get_category_spending(start_date, end_date)
+        plt = _load_pyplot()
+        
+        category_data = self.db.get_category_spending(start_date, end_date, top_n=top_n)
         
         if not category_data:
             print("No spending data available for this period")
@@ -61,20 +166,20 @@ class FinanceAnalyzer:
         categories = [row[0] for row in category_data]
         amounts = [row[1] for row in category_data]
         
-        plt.figure(figsize=(10, 8))
+        fig = self._get_figure((10, 8))
+        ax = fig.add_subplot(111)
         colors = plt.cm.Set3(range(len(categories)))
         
-        plt.pie(amounts, labels=categories, autopct='%1.1f%%',
-                startangle=90, colors=colors)
-        plt.title(f'Spending by Category\n{start_date} to {end_date}')
-        plt.axis('equal')
+        ax.pie(amounts, labels=categories, autopct='%1.1f%%',
+               startangle=90, colors=colors)
+        ax.set_title(f'Spending by Category\n{start_date} to {end_date}')
+        ax.axis('equal')
         
         if not save_path:
             save_path = f'reports/spending_pie_{start_date}_to_{end_date}.png'
         
         os.makedirs(os.path.dirname(save_path), exist_ok=True)
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.savefig(save_path, dpi=CHART_DPI, bbox_inches='tight')
         
         return save_path
     
@@ -89,42 +194,70 @@ class FinanceAnalyzer:
         Returns:
             Path to saved chart
         """
+        if months < 1:
+            print("Number of months must be at least 1")
+            return None
+        
+        # Step back one calendar month at a time; fixed 30-day steps drift and
+        # can skip or repeat months
         today = datetime.now()
-        monthly_data = []
+        year, month = today.year, today.month
+        month_keys = []
+        
+        for _ in range(months):
+            month_keys.append((year, month))
+            month -= 1
+            if month == 0:
+                month = 12
+                year -= 1
+        
+        month_keys.reverse()
         
-        for i in range(months):
-            month_date = today - timedelta(days=30*i)
-            summary = self.db.get_monthly_summary(month_date.year, month_date.month)
-            monthly_data.append(summary)
+        # Fetch every month in one grouped query instead of one query per month
+        first_year, first_month = month_keys[0]
+        last_year, last_month = month_keys[-1]
+        start_date, _ = month_bounds(first_year, first_month)
+        _, end_date = month_bounds(last_year, last_month)
         
-        monthly_data.reverse()
+        summaries = self.db.get_monthly_summaries(start_date, end_date)
+        
+        monthly_data = []
+        for year, month in month_keys:
+            key = f"{year}-{month:02d}"
+            monthly_data.append(summaries.get(key, {
+                'income': 0,
+                'expenses': 0,
+                'balance': 0,
+                'month': key
+            }))
         
         months_labels = [data['month'] for data in monthly_data]
         income = [data['income'] for data in monthly_data]
         expenses = [data['expenses'] for data in monthly_data]
         balance = [data['balance'] for data in monthly_data]
         
-        plt.figure(figsize=(12, 6))
+        fig = self._get_figure((12, 6))
+        ax = fig.add_subplot(111)
         
         x = range(len(months_labels))
-        plt.plot(x, income, marker='o', label='Income', linewidth=2, color='green')
-        plt.plot(x, expenses, marker='s', label='Expenses', linewidth=2, color='red')
-        plt.plot(x, balance, marker='^', label='Balance', linewidth=2, color='blue')
-        
-        plt.xlabel('Month')
-        plt.ylabel('Amount ($)')
-        plt.title(f'Financial Trend - Last {months} Months')
-        plt.xticks(x, months_labels, rotation=45)
-        plt.legend()
-        plt.grid(True, alpha=0.3)
-        plt.tight_layout()
+        ax.plot(x, income, marker='o', label='Income', linewidth=2, color='green')
+        ax.plot(x, expenses, marker='s', label='Expenses', linewidth=2, color='red')
+        ax.plot(x, balance, marker='^', label='Balance', linewidth=2, color='blue')
+        
+        ax.set_xlabel('Month')
+        ax.set_ylabel('Amount ($)')
+        ax.set_title(f'Financial Trend - Last {months} Months')
+        ax.set_xticks(x)
+        ax.set_xticklabels(months_labels, rotation=45)
+        ax.legend()
+        ax.grid(True, alpha=0.3)
+        fig.tight_layout()
         
         if not save_path:
             save_path = f'reports/trend_{months}months.png'
         
         os.makedirs(os.path.dirname(save_path), exist_ok=True)
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.savefig(save_path, dpi=CHART_DPI, bbox_inches='tight')
         
         return save_path
     
@@ -141,23 +274,14 @@ class FinanceAnalyzer:
         Returns:
             Path to saved chart
         """
-        start_date = f"{year}-{month:02d}-01"
-        if month == 12:
-            end_date = f"{year+1}-01-01"
-        else:
-            end_date = f"{year}-{month+1:02d}-01"
+        budget_data = self.db.get_budget_vs_actual(year, month)
         
-        category_data = self.db.get_category_spending(start_date, end_date)
-        categories_with_budget = self.db.get_categories('expense')
+        categories = [row[0] for row in budget_data]
+        budgets = [row[1] for row in budget_data]
+        spending = [row[2] for row in budget_data]
         
-        budget_dict = {cat[0]: cat[1] for cat in categories_with_budget if cat[1] > 0}
-        spending_dict = {cat[0]: cat[1] for cat in category_data}
-        
-        categories = list(budget_dict.keys())
-        budgets = [budget_dict[cat] for cat in categories]
-        spending = [spending_dict.get(cat, 0) for cat in categories]
-        
-        fig, ax = plt.subplots(figsize=(12, 6))
+        fig = self._get_figure((12, 6))
+        ax = fig.add_subplot(111)
         
         x = range(len(categories))
         width = 0.35
@@ -182,14 +306,13 @@ class FinanceAnalyzer:
                    f'${height:.0f}',
                    ha='center', va='bottom', fontsize=8)
         
-        plt.tight_layout()
+        fig.tight_layout()
         
         if not save_path:
             save_path = f'reports/budget_comparison_{year}_{month:02d}.png'
         
         os.makedirs(os.path.dirname(save_path), exist_ok=True)
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.savefig(save_path, dpi=CHART_DPI, bbox_inches='tight')
         
         return save_path
     
@@ -204,8 +327,10 @@ class FinanceAnalyzer:
         Returns:
             Formatted text report
         """
-        summary = self.db.get_monthly_summary(year, month)
-        alerts = self.db.check_budget_alerts(year, month)
+        month_report = self.get_month_report(year, month)
+        summary = month_report.summary
+        alerts = month_report.alerts
+        category_data = month_report.category_data
         
         report = f"""
 {'='*60}
@@ -232,20 +357,12 @@ Balance:         ${summary['balance']:,.2f}
             report += "[OK] All spending within budget limits\n\n"
         
         # Top spending categories
-        start_date = f"{year}-{month:02d}-01"
-        if month == 12:
-            end_date = f"{year+1}-01-01"
-        else:
-            end_date = f"{year}-{month+1:02d}-01"
-        
-        category_data = self.db.get_category_spending(start_date, end_date)
-        
         if category_data:
             report += "TOP SPENDING CATEGORIES:\n"
             report += "-" * 60 + "\n"
+            scale = 100 / summary['expenses'] if summary['expenses'] > 0 else 0
             for i, (category, amount) in enumerate(category_data[:5], 1):
-                percentage = (amount / summary['expenses'] * 100) if summary['expenses'] > 0 else 0
-                report += f"{i}. {category}: ${amount:.2f} ({percentage:.1f}%)\n"
+                report += f"{i}. {category}: ${amount:.2f} ({amount * scale:.1f}%)\n"
         
         report += "\n" + "="*60 + "\n"
         
@@ -264,9 +381,11 @@ Balance:         ${summary['balance']:,.2f}
         Returns:
             Path to exported file
         """
-        df = self.generate_spending_report(start_date, end_date)
+        # Stream rows straight from the database instead of building a DataFrame
+        rows = self.db.iter_transactions(start_date, end_date)
+        first_row = next(rows, None)
         
-        if df.empty:
+        if first_row is None:
             print("No data to export")
             return None
         
@@ -274,6 +393,11 @@ Balance:         ${summary['balance']:,.2f}
             filename = f'reports/transactions_{start_date}_to_{end_date}.csv'
         
         os.makedirs(os.path.dirname(filename), exist_ok=True)
-        df.to_csv(filename, index=False)
+        with open(filename, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(['id', 'date', 'description', 'amount',
+                             'category', 'type', 'created_at'])
+            writer.writerow(first_row)
+            writer.writerows(rows)
         
         return filename
\ No newline at end of file
@@ -3,7 +3,78 @@ Auto-categorization module for transactions
 Uses keyword matching to automatically categorize transactions
 """
 
-from typing import Dict, List
+from collections import deque
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+# Words that mark otherwise uncategorized income as salary or freelance work
+SALARY_WORDS = ('salary', 'payroll', 'employer')
+FREELANCE_WORDS = ('freelance', 'consulting', 'contract')
+
+
+class _KeywordAutomaton:
+    # Aho-Corasick automaton: finds every keyword in a text in a single pass
+    
+    def __init__(self, keywords: List[Tuple[str, int]]):
+        # Build the trie and failure links for (keyword, priority) pairs
+        goto: List[Dict[str, int]] = [{}]
+        self._best: List[Optional[int]] = [None]
+        
+        for keyword, priority in keywords:
+            state = 0
+            for char in keyword:
+                next_state = goto[state].get(char)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto.append({})
+                    self._best.append(None)
+                    goto[state][char] = next_state
+                state = next_state
+            self._best[state] = self._min_priority(self._best[state], priority)
+        
+        # Breadth-first pass: each state falls back to the longest proper
+        # suffix that is also in the trie, and inherits that suffix's matches.
+        # The fallbacks are folded into each state's transition table, so
+        # matching never has to walk failure links.
+        fail = [0] * len(goto)
+        self._next: List[Dict[str, int]] = [goto[0]] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            fallback = fail[state]
+            self._next[state] = {**self._next[fallback], **goto[state]}
+            for char, next_state in goto[state].items():
+                fail[next_state] = self._next[fallback].get(char, 0)
+                self._best[next_state] = self._min_priority(
+                    self._best[next_state], self._best[fail[next_state]]
+                )
+                queue.append(next_state)
+    
+    @staticmethod
+    def _min_priority(a: Optional[int], b: Optional[int]) -> Optional[int]:
+        # Lower number wins; None means no keyword ends here
+        if a is None:
+            return b
+        if b is None:
+            return a
+        return min(a, b)
+    
+    def best_match(self, text: str) -> Optional[int]:
+        # Return the lowest priority of any keyword found in text, or None
+        next_at, best_at = self._next, self._best
+        state = 0
+        best = best_at[0]
+        
+        for char in text:
+            state = next_at[state].get(char, 0)
+            priority = best_at[state]
+            if priority is not None and (best is None or priority < best):
+                # Nothing can beat the first category, so stop scanning
+                if priority == 0:
+                    return 0
+                best = priority
+        
+        return best
 
 
 class TransactionCategorizer:
@@ -11,6 +82,8 @@ class TransactionCategorizer:
     
     def __init__(self):
         # Initialize with keyword mappings
+        # Matching uses an automaton compiled from these lists, so change
+        # keywords through add_keyword only; direct edits are not picked up
         self.category_keywords = {
             'Food & Dining': [
                 'restaurant', 'cafe', 'food', 'grocery', 'supermarket',
@@ -51,6 +124,22 @@ class TransactionCategorizer:
                 'side job', 'project payment'
             ]
         }
+        self._build_automaton()
+    
+    def _build_automaton(self):
+        # Compile all keywords into one automaton; a keyword's priority is its
+        # category's position, so the earliest category still wins
+        self._categories = list(self.category_keywords)
+        self._automaton = _KeywordAutomaton([
+            (keyword, priority)
+            for priority, keywords in enumerate(self.category_keywords.values())
+            for keyword in keywords
+        ])
+        
+        # Statements repeat the same merchants, so memoize on the lowercased
+        # description; fresh caches are created whenever the keywords change
+        self._categorize_cached = lru_cache(maxsize=4096)(self._categorize_lower)
+        self._suggest_cached = lru_cache(maxsize=4096)(self._suggest_lower)
     
     def categorize(self, description: str) -> str:
         """
@@ -62,13 +151,13 @@ class TransactionCategorizer:
         Returns:
             Category name or 'Other Expenses'/'Other Income' if no match
         """
-        description_lower = description.lower()
-        
-        # Check each category's keywords
-        for category, keywords in self.category_keywords.items():
-            for keyword in keywords:
-                if keyword in description_lower:
-                    return category
+        return self._categorize_cached(description.lower())
+    
+    def _categorize_lower(self, description_lower: str) -> str:
+        # Scan the description once for every category's keywords
+        priority = self._automaton.best_match(description_lower)
+        if priority is not None:
+            return self._categories[priority]
         
         # Default categories
         return 'Other Expenses'
@@ -84,13 +173,17 @@ class TransactionCategorizer:
         Returns:
             Suggested category name
         """
-        base_category = self.categorize(description)
+        # Only the sign of the amount affects the suggestion
+        return self._suggest_cached(description.lower(), amount > 0)
+    
+    def _suggest_lower(self, description_lower: str, is_income: bool) -> str:
+        base_category = self._categorize_cached(description_lower)
         
         # If it's income and not categorized as Salary/Freelance
-        if amount > 0 and base_category.startswith('Other'):
-            if any(word in description.lower() for word in ['salary', 'payroll', 'employer']):
+        if is_income and base_category.startswith('Other'):
+            if any(word in description_lower for word in SALARY_WORDS):
                 return 'Salary'
-            elif any(word in description.lower() for word in ['freelance', 'consulting', 'contract']):
+            elif any(word in description_lower for word in FREELANCE_WORDS):
                 return 'Freelance'
             else:
                 return 'Other Income'
@@ -104,7 +197,10 @@ class TransactionCategorizer:
                 self.category_keywords[category].append(keyword.lower())
         else:
             self.category_keywords[category] = [keyword.lower()]
+        
+        self._build_automaton()
     
     def get_category_keywords(self, category: str) -> List[str]:
         # Get all keywords for a specific category
-        return self.category_keywords.get(category, [])
\ No newline at end of file
+        # Returns a copy; use add_keyword to change a category's keywords
+        return list(self.category_keywords.get(category, []))
\ No newline at end of file
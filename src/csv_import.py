@@ -4,10 +4,43 @@ Handles importing transactions from CSV files
 """
 
 import csv
+import os
+import re
 from datetime import datetime
-from typing import List, Dict
+from operator import itemgetter
+from typing import List, Dict, Iterator, Optional, Tuple
 from .categorizer import TransactionCategorizer
 
+# Imports from files at least this large rebuild the transaction indexes
+# once at the end instead of updating them row by row
+LARGE_IMPORT_BYTES = 10 * 1024 * 1024
+
+# Read buffer for CSV files; larger than the default to cut read calls
+CSV_READ_BUFFER = 1 << 20
+
+# Number of skipped rows listed individually in the end-of-file report
+MAX_REPORTED_SKIPS = 10
+
+TRANSACTION_FIELDS = ('date', 'description', 'amount', 'category', 'type')
+
+# Date formats accepted by the importer, tried in this order
+DATE_FORMATS = (
+    '%Y-%m-%d',
+    '%m/%d/%Y',
+    '%d/%m/%Y',
+    '%Y/%m/%d',
+    '%m-%d-%Y',
+    '%d-%m-%Y',
+    '%b %d, %Y',
+    '%B %d, %Y'
+)
+
+# Currency symbols, thousands separators and whitespace dropped from amounts
+AMOUNT_STRIP_TABLE = str.maketrans('', '', '$€£, \t')
+
+# Amounts written in parentheses are negative, e.g. (45.00)
+PAREN_AMOUNT_RE = re.compile(r'^\((.*)\)$')
+
 
 class CSVImporter:
     # Import transactions from CSV files
@@ -35,62 +68,100 @@ class CSVImporter:
         Returns:
             List of transaction dictionaries
         """
-        transactions = []
+        return [
+            dict(zip(TRANSACTION_FIELDS, row))
+            for row in self._iter_rows(filepath, date_col, desc_col,
+                                       amount_col, skip_header)
+        ]
+    
+    def _iter_rows(self, filepath: str, date_col: str, desc_col: str,
+                   amount_col: str, skip_header: bool) -> Iterator[Tuple]:
+        # Yield (date, description, amount, category, type) tuples one CSV row
+        # at a time so imports never hold the whole file in memory
         
-        with open(filepath, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f) if skip_header else csv.reader(f)
+        # Exports repeat the same dates on many rows, so each distinct date
+        # string is parsed once per file
+        parsed_dates = {}
+        
+        # Skipped rows are reported once at the end rather than printed one by one
+        skipped = []
+        
+        # newline='' leaves line endings to the csv module, as it expects
+        with open(filepath, 'r', encoding='utf-8', newline='',
+                  buffering=CSV_READ_BUFFER) as f:
+            # Pick the row layout once instead of re-checking it on every row
+            if skip_header:
+                reader = csv.DictReader(f)
+                extract = lambda row: (row.get(date_col, ''),
+                                       row.get(desc_col, ''),
+                                       row.get(amount_col, '0'))
+            else:
+                # Assume order: Date, Description, Amount
+                reader = csv.reader(f)
+                extract = itemgetter(0, 1, 2)
             
-            for row in reader:
-                if skip_header:
-                    date_str = row.get(date_col, '')
-                    description = row.get(desc_col, '')
-                    amount_str = row.get(amount_col, '0')
-                else:
-                    # Assume order: Date, Description, Amount
-                    date_str = row[0]
-                    description = row[1]
-                    amount_str = row[2]
-                
-                # Parse date
-                try:
-                    date = self._parse_date(date_str)
-                except:
-                    print(f"Skipping row with invalid date: {date_str}")
-                    continue
-                
-                # Parse amount
-                try:
-                    amount = self._parse_amount(amount_str)
-                except:
-                    print(f"Skipping row with invalid amount: {amount_str}")
-                    continue
-                
-                # Determine type and category
-                trans_type = 'income' if amount > 0 else 'expense'
-                amount = abs(amount)
-                category = self.categorizer.get_suggested_category(
-                    description, 
-                    amount if trans_type == 'income' else -amount
-                )
-                
-                transactions.append({
-                    'date': date,
-                    'description': description,
-                    'amount': amount,
-                    'category': category,
-                    'type': trans_type
-                })
+            try:
+                for row in reader:
+                    try:
+                        date_str, description, amount_str = extract(row)
+                    except IndexError:
+                        # DictReader skips blank lines; do the same without a header
+                        if not row:
+                            continue
+                        date_str = None
+                    
+                    # Columns missing from a short row come back as None
+                    if date_str is None or description is None or amount_str is None:
+                        skipped.append(f"line {reader.line_num}: missing columns")
+                        continue
+                    
+                    # Parse date
+                    date = parsed_dates.get(date_str)
+                    if date is None:
+                        try:
+                            date = self._parse_date(date_str)
+                        except:
+                            skipped.append(f"line {reader.line_num}: invalid date: {date_str}")
+                            continue
+                        parsed_dates[date_str] = date
+                    
+                    # Parse amount
+                    try:
+                        amount = self._parse_amount(amount_str)
+                    except:
+                        skipped.append(f"line {reader.line_num}: invalid amount: {amount_str}")
+                        continue
+                    
+                    # Determine category from the signed amount, then type
+                    category = self.categorizer.get_suggested_category(description, amount)
+                    trans_type = 'income' if amount > 0 else 'expense'
+                    amount = abs(amount)
+                    
+                    yield (date, description, amount, category, trans_type)
+            except csv.Error as e:
+                # DictReader only updates line_num once a row parses, so ask the
+                # underlying reader which line it stopped on
+                line_num = reader.reader.line_num if skip_header else reader.line_num
+                raise ValueError(f"line {line_num}: {e}") from e
         
-        return transactions
+        if skipped:
+            lines = [f"Skipped {len(skipped)} invalid rows:"]
+            lines.extend(f"  {message}" for message in skipped[:MAX_REPORTED_SKIPS])
+            if len(skipped) > MAX_REPORTED_SKIPS:
+                lines.append(f"  ... and {len(skipped) - MAX_REPORTED_SKIPS} more")
+            print("\n".join(lines))
     
     def import_transactions(self, filepath: str, 
                           date_col: str = 'Date',
                           desc_col: str = 'Description',
                           amount_col: str = 'Amount',
-                          skip_header: bool = True) -> int:
+                          skip_header: bool = True) -> Optional[int]:
         """
         Import transactions from CSV into database
         
+        Rows with missing columns or an invalid date or amount are skipped.
+        Any other error aborts the import and rolls back every row.
+        
         Args:
             filepath: Path to CSV file
             date_col: Name of date column
@@ -99,46 +170,27 @@ class CSVImporter:
             skip_header: Whether first row is header
             
         Returns:
-            Number of transactions imported
+            Number of transactions imported, or None if the import failed
         """
-        transactions = self.parse_csv(filepath, date_col, desc_col, 
-                                     amount_col, skip_header)
-        
-        count = 0
-        for trans in transactions:
-            try:
-                self.db.add_transaction(
-                    trans['date'],
-                    trans['description'],
-                    trans['amount'],
-                    trans['category'],
-                    trans['type']
-                )
-                count += 1
-            except Exception as e:
-                print(f"Error importing transaction: {e}")
-        
-        return count
+        try:
+            rebuild_indexes = os.path.getsize(filepath) >= LARGE_IMPORT_BYTES
+            rows = self._iter_rows(filepath, date_col, desc_col,
+                                   amount_col, skip_header)
+            return self.db.add_transactions_bulk(rows, rebuild_indexes=rebuild_indexes)
+        except Exception as e:
+            print(f"Error importing transactions, nothing was imported: {e}")
+            return None
     
     def _parse_date(self, date_str: str) -> str:
         """
         Parse date string into YYYY-MM-DD format
         Handles multiple common date formats
         """
-        date_formats = [
-            '%Y-%m-%d',
-            '%m/%d/%Y',
-            '%d/%m/%Y',
-            '%Y/%m/%d',
-            '%m-%d-%Y',
-            '%d-%m-%Y',
-            '%b %d, %Y',
-            '%B %d, %Y'
-        ]
-        
         date_str = date_str.strip()
         
-        for fmt in date_formats:
+        # Always try the formats in the same order so an ambiguous date such
+        # as 02/03/2026 parses the same way wherever it appears
+        for fmt in DATE_FORMATS:
             try:
                 dt = datetime.strptime(date_str, fmt)
                 return dt.strftime('%Y-%m-%d')
@@ -152,14 +204,15 @@ class CSVImporter:
         Parse amount string into float
         Handles currency symbols, commas, parentheses for negatives
         """
-        # Remove common currency symbols and whitespace
+        # Trim any surrounding whitespace (including NBSP and thin spaces),
+        # then remove common currency symbols and inner spaces in one pass
         amount_str = amount_str.strip()
-        amount_str = amount_str.replace('$', '').replace('€', '')
-        amount_str = amount_str.replace('£', '').replace(',', '')
+        amount_str = amount_str.translate(AMOUNT_STRIP_TABLE)
         
         # Handle parentheses as negative
-        if '(' in amount_str and ')' in amount_str:
-            amount_str = amount_str.replace('(', '-').replace(')', '')
+        match = PAREN_AMOUNT_RE.match(amount_str)
+        if match:
+            amount_str = '-' + match.group(1)
         
         return float(amount_str)
     
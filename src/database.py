@@ -5,21 +5,57 @@ Handles all database operations using SQLite
 
 import sqlite3
 from datetime import datetime
-from typing import List, Tuple, Optional
+from typing import Iterable, Iterator, List, Tuple, Optional
 import os
 
+# Shared by the single and bulk insert paths so both reuse one cached statement
+INSERT_TRANSACTION_SQL = """
+    INSERT INTO transactions (date, description, amount, category, type)
+    VALUES (?, ?, ?, ?, ?)
+"""
+
+
+def month_bounds(year: int, month: int) -> Tuple[str, str]:
+    # Get (first day, first day of next month) for a half-open month range
+    start_date = f"{year}-{month:02d}-01"
+    if month == 12:
+        end_date = f"{year+1}-01-01"
+    else:
+        end_date = f"{year}-{month+1:02d}-01"
+    
+    return start_date, end_date
+
 
 class FinanceDatabase:
     # Manages database operations for finance tracking
     
+    # Secondary indexes on transactions: (name, indexed columns)
+    TRANSACTION_INDEXES = [
+        ('idx_trans_date_type', 'date, type'),
+        ('idx_trans_type_date', 'type, date'),
+        ('idx_trans_cat_date', 'category, date')
+    ]
+    
     def __init__(self, db_path: str = "data/finance.db"):
         # Initialize database connection
         self.db_path = db_path
         os.makedirs(os.path.dirname(db_path), exist_ok=True)
         self.conn = sqlite3.connect(db_path)
         self.cursor = self.conn.cursor()
+        self._cat_cache = {}
+        # Bumped on every data change so callers can invalidate their caches
+        self.write_epoch = 0
+        self._configure_connection()
         self._create_tables()
     
+    def _configure_connection(self):
+        # WAL journal with NORMAL sync avoids the extra fsyncs on every commit
+        self.cursor.execute("PRAGMA journal_mode=WAL")
+        self.cursor.execute("PRAGMA synchronous=NORMAL")
+        self.cursor.execute("PRAGMA temp_store=MEMORY")
+        self.cursor.execute("PRAGMA cache_size=-65536")
+        self.cursor.execute("PRAGMA mmap_size=268435456")
+    
     def _create_tables(self):
         # Create necessary tables if they don't exist
         
@@ -36,6 +72,9 @@ class FinanceDatabase:
             )
         """)
         
+        # Indexes for date-range reports grouped by type or category
+        self._create_indexes()
+        
         # Categories table with budget limits
         self.cursor.execute("""
             CREATE TABLE IF NOT EXISTS categories (
@@ -62,6 +101,18 @@ class FinanceDatabase:
         self.conn.commit()
         self._initialize_default_categories()
     
+    def _create_indexes(self):
+        # Create the secondary indexes on transactions
+        for name, columns in self.TRANSACTION_INDEXES:
+            self.cursor.execute(
+                f"CREATE INDEX IF NOT EXISTS {name} ON transactions ({columns})"
+            )
+    
+    def _drop_indexes(self):
+        # Drop the secondary indexes on transactions
+        for name, _ in self.TRANSACTION_INDEXES:
+            self.cursor.execute(f"DROP INDEX IF EXISTS {name}")
+    
     def _initialize_default_categories(self):
         # Add default categories if database is empty
         default_categories = [
@@ -77,32 +128,60 @@ class FinanceDatabase:
             ('Other Income', 0, 'income')
         ]
         
-        for name, budget, cat_type in default_categories:
-            try:
-                self.cursor.execute(
-                    "INSERT OR IGNORE INTO categories (name, budget_limit, type) VALUES (?, ?, ?)",
-                    (name, budget, cat_type)
-                )
-            except sqlite3.IntegrityError:
-                pass
+        # OR IGNORE skips categories that already exist
+        self.cursor.executemany(
+            "INSERT OR IGNORE INTO categories (name, budget_limit, type) VALUES (?, ?, ?)",
+            default_categories
+        )
         
         self.conn.commit()
     
     def add_transaction(self, date: str, description: str, amount: float, 
                        category: str, trans_type: str) -> int:
         # Add a new transaction
-        self.cursor.execute("""
-            INSERT INTO transactions (date, description, amount, category, type)
-            VALUES (?, ?, ?, ?, ?)
-        """, (date, description, amount, category, trans_type))
+        self.cursor.execute(INSERT_TRANSACTION_SQL,
+                            (date, description, amount, category, trans_type))
         
         self.conn.commit()
+        self.write_epoch += 1
         return self.cursor.lastrowid
     
+    def add_transactions_bulk(self, rows: Iterable[Tuple],
+                              rebuild_indexes: bool = False) -> int:
+        """
+        Add many transactions in a single database transaction
+        
+        Args:
+            rows: (date, description, amount, category, type) tuples; may be
+                a generator, which is consumed while inserting
+            rebuild_indexes: Drop the secondary indexes before inserting and
+                rebuild them afterwards, which is faster for very large batches
+            
+        Returns:
+            Number of transactions added
+        """
+        # One commit for the whole batch instead of one per row; the explicit
+        # BEGIN keeps the index drop/rebuild inside the same transaction
+        with self.conn:
+            self.cursor.execute("BEGIN IMMEDIATE")
+            if rebuild_indexes:
+                self._drop_indexes()
+            
+            self.cursor.executemany(INSERT_TRANSACTION_SQL, rows)
+            count = self.cursor.rowcount
+            
+            if rebuild_indexes:
+                self._create_indexes()
+        self.write_epoch += 1
+        
+        return count
+    
     def get_transactions(self, start_date: Optional[str] = None, 
                         end_date: Optional[str] = None,
-                        category: Optional[str] = None) -> List[Tuple]:
-        # Get transactions with optional filters
+                        category: Optional[str] = None,
+                        limit: Optional[int] = None,
+                        offset: int = 0) -> List[Tuple]:
+        # Get transactions with optional filters, newest first
         query = "SELECT * FROM transactions WHERE 1=1"
         params = []
         
@@ -118,30 +197,89 @@ class FinanceDatabase:
             query += " AND category = ?"
             params.append(category)
         
-        query += " ORDER BY date DESC"
+        query += " ORDER BY date DESC, id DESC"
+        
+        # Page at SQL level so large histories are never fully materialized
+        if limit is not None:
+            query += " LIMIT ? OFFSET ?"
+            params.extend([limit, offset])
         
         self.cursor.execute(query, params)
         return self.cursor.fetchall()
     
-    def get_category_spending(self, start_date: str, end_date: str) -> List[Tuple]:
-        # Get spending by category for a date range
+    def iter_transactions(self, start_date: str, end_date: str,
+                          batch_size: int = 1000) -> Iterator[Tuple]:
+        """
+        Stream transactions in a date range without loading them all at once
+        
+        Args:
+            start_date: Start date (YYYY-MM-DD)
+            end_date: End date (YYYY-MM-DD)
+            batch_size: Number of rows fetched per round-trip
+            
+        Yields:
+            Transaction rows, newest first
+        """
+        # Use a dedicated cursor so other queries can run while streaming
+        cursor = self.conn.execute("""
+            SELECT * FROM transactions
+            WHERE date >= ? AND date <= ?
+            ORDER BY date DESC, id DESC
+        """, (start_date, end_date))
+        
+        try:
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield from rows
+        finally:
+            cursor.close()
+    
+    def get_period_totals(self, start_date: str, end_date: str) -> Tuple[float, float]:
+        # Get (income, expense) totals for a date range, inclusive of both ends
         self.cursor.execute("""
+            SELECT type, SUM(amount) as total
+            FROM transactions
+            WHERE date >= ? AND date <= ?
+            GROUP BY type
+        """, (start_date, end_date))
+        
+        results = dict(self.cursor.fetchall())
+        return results.get('income', 0), results.get('expense', 0)
+    
+    def get_category_spending(self, start_date: str, end_date: str,
+                              top_n: Optional[int] = None) -> List[Tuple]:
+        # Get spending by category for a date range
+        # With top_n, categories past the first top_n are folded into 'Other'
+        query = """
             SELECT category, SUM(amount) as total
             FROM transactions
             WHERE type = 'expense' AND date BETWEEN ? AND ?
             GROUP BY category
             ORDER BY total DESC
-        """, (start_date, end_date))
+        """
         
-        return self.cursor.fetchall()
+        if top_n is None:
+            self.cursor.execute(query, (start_date, end_date))
+            return self.cursor.fetchall()
+        
+        self.cursor.execute(query + " LIMIT ?", (start_date, end_date, top_n))
+        spending = self.cursor.fetchall()
+        
+        self.cursor.execute(f"""
+            SELECT SUM(total) FROM ({query} LIMIT -1 OFFSET ?)
+        """, (start_date, end_date, top_n))
+        other_total = self.cursor.fetchone()[0]
+        
+        if other_total:
+            spending.append(('Other', other_total))
+        
+        return spending
     
     def get_monthly_summary(self, year: int, month: int) -> dict:
         # Get income, expenses, and balance for a month
-        start_date = f"{year}-{month:02d}-01"
-        if month == 12:
-            end_date = f"{year+1}-01-01"
-        else:
-            end_date = f"{year}-{month+1:02d}-01"
+        start_date, end_date = month_bounds(year, month)
         
         self.cursor.execute("""
             SELECT type, SUM(amount) as total
@@ -161,44 +299,123 @@ class FinanceDatabase:
             'month': f"{year}-{month:02d}"
         }
     
+    def get_monthly_summaries(self, start_date: str, end_date: str) -> dict:
+        """
+        Get income, expenses, and balance for every month in a date range
+        
+        Args:
+            start_date: First day of the range (YYYY-MM-DD, inclusive)
+            end_date: End of the range (YYYY-MM-DD, exclusive)
+            
+        Returns:
+            Dict mapping 'YYYY-MM' to a summary dict like get_monthly_summary;
+            months without transactions are omitted
+        """
+        self.cursor.execute("""
+            SELECT substr(date, 1, 7) as month, type, SUM(amount) as total
+            FROM transactions
+            WHERE date >= ? AND date < ?
+            GROUP BY month, type
+        """, (start_date, end_date))
+        
+        summaries = {}
+        for month, trans_type, total in self.cursor.fetchall():
+            summary = summaries.setdefault(month, {
+                'income': 0,
+                'expenses': 0,
+                'balance': 0,
+                'month': month
+            })
+            if trans_type == 'income':
+                summary['income'] = total
+            elif trans_type == 'expense':
+                summary['expenses'] = total
+            summary['balance'] = summary['income'] - summary['expenses']
+        
+        return summaries
+    
+    def get_month_breakdown(self, year: int, month: int) -> List[Tuple]:
+        # Get (category, type, total) rows for a month in a single pass
+        start_date, end_date = month_bounds(year, month)
+        
+        self.cursor.execute("""
+            SELECT category, type, SUM(amount) as total
+            FROM transactions
+            WHERE date >= ? AND date < ?
+            GROUP BY category, type
+            ORDER BY total DESC
+        """, (start_date, end_date))
+        
+        return self.cursor.fetchall()
+    
+    def get_budget_vs_actual(self, year: int, month: int) -> List[Tuple]:
+        # Get (category, budget, spent) for every expense category with a budget
+        start_date, end_date = month_bounds(year, month)
+        
+        self.cursor.execute("""
+            SELECT c.name, c.budget_limit, COALESCE(s.total, 0) as spent
+            FROM categories c
+            LEFT JOIN (
+                SELECT category, SUM(amount) as total
+                FROM transactions
+                WHERE type = 'expense' AND date >= ? AND date < ?
+                GROUP BY category
+            ) s ON s.category = c.name
+            WHERE c.type = 'expense' AND c.budget_limit > 0
+            ORDER BY c.name
+        """, (start_date, end_date))
+        
+        return self.cursor.fetchall()
+    
     def check_budget_alerts(self, year: int, month: int) -> List[dict]:
         # Check which categories exceeded budget
-        start_date = f"{year}-{month:02d}-01"
-        if month == 12:
-            end_date = f"{year+1}-01-01"
-        else:
-            end_date = f"{year}-{month+1:02d}-01"
+        start_date, end_date = month_bounds(year, month)
         
-        self.cursor.execute("""
+        # Named-column rows on a dedicated cursor; the shared cursor keeps
+        # returning plain tuples for every other query
+        cursor = self.conn.cursor()
+        cursor.row_factory = sqlite3.Row
+        
+        # Aggregate the month's expenses first (a range seek on the type/date
+        # index), then join the handful of per-category totals to budgets
+        cursor.execute("""
+            WITH spend AS (
+                SELECT category, SUM(amount) as spent
+                FROM transactions
+                WHERE type = 'expense' AND date >= ? AND date < ?
+                GROUP BY category
+            )
             SELECT 
-                t.category,
-                SUM(t.amount) as spent,
+                s.category,
+                s.spent,
                 c.budget_limit,
-                (SUM(t.amount) / c.budget_limit * 100) as percentage
-            FROM transactions t
-            JOIN categories c ON t.category = c.name
-            WHERE t.type = 'expense' 
-                AND t.date >= ? 
-                AND t.date < ?
-                AND c.budget_limit > 0
-            GROUP BY t.category, c.budget_limit
-            HAVING spent >= c.budget_limit * 0.8
+                (s.spent / c.budget_limit * 100) as percentage
+            FROM spend s
+            JOIN categories c ON c.name = s.category
+            WHERE c.budget_limit > 0 
+                AND s.spent >= c.budget_limit * 0.8
             ORDER BY percentage DESC
         """, (start_date, end_date))
         
-        alerts = []
-        for row in self.cursor.fetchall():
-            alerts.append({
-                'category': row[0],
-                'spent': row[1],
-                'limit': row[2],
-                'percentage': row[3]
-            })
+        # Build the alerts straight from the cursor without a fetchall() copy
+        alerts = [
+            {
+                'category': row['category'],
+                'spent': row['spent'],
+                'limit': row['budget_limit'],
+                'percentage': row['percentage']
+            }
+            for row in cursor
+        ]
         
         return alerts
     
     def get_categories(self, cat_type: Optional[str] = None) -> List[Tuple]:
         # Get all categories, optionally filtered by type
+        # Categories rarely change, so results are cached until a budget update
+        if cat_type in self._cat_cache:
+            return self._cat_cache[cat_type]
+        
         if cat_type:
             self.cursor.execute(
                 "SELECT name, budget_limit FROM categories WHERE type = ? ORDER BY name",
@@ -207,7 +424,9 @@ class FinanceDatabase:
         else:
             self.cursor.execute("SELECT name, budget_limit, type FROM categories ORDER BY name")
         
-        return self.cursor.fetchall()
+        categories = self.cursor.fetchall()
+        self._cat_cache[cat_type] = categories
+        return categories
     
     def update_budget_limit(self, category: str, new_limit: float):
         # Update budget limit for a category
@@ -216,11 +435,34 @@ class FinanceDatabase:
             (new_limit, category)
         )
         self.conn.commit()
+        self._cat_cache.clear()
+        self.write_epoch += 1
     
     def delete_transaction(self, transaction_id: int):
         # Delete a transaction by ID
         self.cursor.execute("DELETE FROM transactions WHERE id = ?", (transaction_id,))
         self.conn.commit()
+        self.write_epoch += 1
+    
+    def delete_transactions(self, transaction_ids: List[int]) -> int:
+        # Delete several transactions by ID in one statement and one commit
+        # IDs are sent in chunks to stay under SQLite's bound-parameter limit
+        transaction_ids = list(transaction_ids)
+        chunk_size = 500
+        deleted = 0
+        
+        with self.conn:
+            for i in range(0, len(transaction_ids), chunk_size):
+                chunk = transaction_ids[i:i + chunk_size]
+                placeholders = ','.join('?' * len(chunk))
+                self.cursor.execute(
+                    f"DELETE FROM transactions WHERE id IN ({placeholders})",
+                    chunk
+                )
+                deleted += self.cursor.rowcount
+        self.write_epoch += 1
+        
+        return deleted
     
     def close(self):
         # Close database connection
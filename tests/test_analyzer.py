@@ -0,0 +1,83 @@
+"""
+Unit tests for the analyzer module
+Run with: python -m pytest tests/
+"""
+
+import unittest
+import sys
+import os
+import shutil
+import tempfile
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from src.database import FinanceDatabase
+from src.analyzer import FinanceAnalyzer
+
+
+class TestFinanceAnalyzer(unittest.TestCase):
+    # Test cases for report generation
+    
+    def setUp(self):
+        # Set up a fresh database in a temporary directory
+        self.tmp_dir = tempfile.mkdtemp()
+        self.db = FinanceDatabase(os.path.join(self.tmp_dir, 'finance.db'))
+        self.analyzer = FinanceAnalyzer(self.db)
+        self.db.add_transactions_bulk([
+            ('2026-02-01', 'Salary', 3000.0, 'Salary', 'income'),
+            ('2026-02-05', 'Grocery', 450.0, 'Food & Dining', 'expense'),
+            ('2026-02-09', 'Movie', 200.0, 'Entertainment', 'expense'),
+            ('2026-02-12', 'Bus pass', 50.0, 'Transportation', 'expense')
+        ])
+    
+    def tearDown(self):
+        # Close the connection and remove the temporary directory
+        self.db.close()
+        shutil.rmtree(self.tmp_dir)
+    
+    def test_month_report(self):
+        # Test summary, category spending and alerts for a month
+        report = self.analyzer.get_month_report(2026, 2)
+        
+        self.assertEqual(report.summary, self.db.get_monthly_summary(2026, 2))
+        self.assertEqual(report.category_data, [
+            ('Food & Dining', 450.0),
+            ('Entertainment', 200.0),
+            ('Transportation', 50.0)
+        ])
+        self.assertEqual(report.alerts, self.db.check_budget_alerts(2026, 2))
+        self.assertEqual([a['category'] for a in report.alerts],
+                         ['Entertainment', 'Food & Dining'])
+    
+    def test_month_report_invalidated_on_write(self):
+        # Test that cached reports are refreshed after a data change
+        before = self.analyzer.get_month_report(2026, 2)
+        self.assertIs(self.analyzer.get_month_report(2026, 2), before)
+        
+        self.db.add_transaction('2026-02-20', 'Pharmacy', 30.0, 'Healthcare', 'expense')
+        after = self.analyzer.get_month_report(2026, 2)
+        
+        self.assertEqual(after.summary['expenses'], 730.0)
+        
+        self.db.update_budget_limit('Entertainment', 1000)
+        self.assertEqual([a['category'] for a in self.analyzer.get_month_report(2026, 2).alerts],
+                         ['Food & Dining'])
+    
+    def test_text_report(self):
+        # Test the text report contents
+        report = self.analyzer.generate_text_report(2026, 2)
+        
+        self.assertIn("MONTHLY FINANCIAL REPORT - 2026-02", report)
+        self.assertIn("Total Expenses:  $700.00", report)
+        self.assertIn("[!] EXCEEDED - Entertainment", report)
+        self.assertIn("1. Food & Dining: $450.00 (64.3%)", report)
+    
+    def test_monthly_trend_needs_a_month(self):
+        # Test that an empty trend window is rejected before any charting
+        self.assertIsNone(self.analyzer.plot_monthly_trend(0))
+        self.assertIsNone(self.analyzer.plot_monthly_trend(-3))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -123,6 +123,66 @@ class TestTransactionCategorizer(unittest.TestCase):
         self.categorizer.add_keyword("Shopping", "mystore")
         result = self.categorizer.categorize("Purchase at MyStore")
         self.assertEqual(result, "Shopping")
+    
+    def test_add_keyword_after_cached_lookup(self):
+        # Test that cached results are dropped when keywords change
+        self.assertEqual(self.categorizer.categorize("Corner Bodega"), "Other Expenses")
+        self.assertEqual(
+            self.categorizer.get_suggested_category("Corner Bodega", -12),
+            "Other Expenses"
+        )
+        
+        self.categorizer.add_keyword("Food & Dining", "bodega")
+        
+        self.assertEqual(self.categorizer.categorize("Corner Bodega"), "Food & Dining")
+        self.assertEqual(
+            self.categorizer.get_suggested_category("Corner Bodega", -12),
+            "Food & Dining"
+        )
+    
+    def test_suggested_category_depends_on_sign(self):
+        # Test that the same description is suggested differently for income
+        self.assertEqual(
+            self.categorizer.get_suggested_category("Transfer from ACME", -50),
+            "Other Expenses"
+        )
+        self.assertEqual(
+            self.categorizer.get_suggested_category("Transfer from ACME", 50),
+            "Other Income"
+        )
+    
+    def test_get_category_keywords_returns_copy(self):
+        # Test that editing the returned list does not change categorization
+        keywords = self.categorizer.get_category_keywords("Food & Dining")
+        keywords.append("bodega")
+        
+        self.assertNotIn("bodega", self.categorizer.get_category_keywords("Food & Dining"))
+        self.assertEqual(self.categorizer.categorize("Corner Bodega"), "Other Expenses")
+    
+    def test_add_keyword_new_category(self):
+        # Test adding a keyword for a category that has none yet
+        self.categorizer.add_keyword("Pets", "Grooming")
+        result = self.categorizer.categorize("Happy Paws GROOMING")
+        self.assertEqual(result, "Pets")
+    
+    def test_category_priority(self):
+        # Test that earlier categories win when several keywords match
+        self.assertEqual(
+            self.categorizer.categorize("Gas station restaurant"),
+            "Food & Dining"
+        )
+        self.assertEqual(
+            self.categorizer.categorize("Uber Eats order"),
+            "Food & Dining"
+        )
+    
+    def test_overlapping_keywords(self):
+        # Test keywords that overlap or end inside other keywords
+        self.categorizer.add_keyword("Alpha", "hers")
+        self.categorizer.add_keyword("Beta", "she")
+        self.assertEqual(self.categorizer.categorize("USHERS"), "Alpha")
+        self.assertEqual(self.categorizer.categorize("hhshe"), "Beta")
+        self.assertEqual(self.categorizer.categorize("hershe"), "Alpha")
 
 
 if __name__ == '__main__':
@@ -0,0 +1,170 @@
+"""
+Unit tests for CSV import
+Run with: python -m pytest tests/
+"""
+
+import unittest
+import csv
+import sys
+import os
+import io
+import shutil
+import tempfile
+from contextlib import redirect_stdout
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from src.database import FinanceDatabase
+from src.csv_import import CSVImporter
+
+
+class TestCSVImporter(unittest.TestCase):
+    # Test cases for parsing and importing CSV files
+    
+    def setUp(self):
+        # Set up a fresh database and the sample CSV
+        self.tmp_dir = tempfile.mkdtemp()
+        self.db = FinanceDatabase(os.path.join(self.tmp_dir, 'finance.db'))
+        self.importer = CSVImporter(self.db)
+        self.csv_path = self.importer.create_sample_csv(
+            os.path.join(self.tmp_dir, 'sample.csv')
+        )
+    
+    def tearDown(self):
+        # Close the connection and remove the temporary directory
+        self.db.close()
+        shutil.rmtree(self.tmp_dir)
+    
+    def test_parse_csv(self):
+        # Test parsing the sample CSV into transaction dictionaries
+        transactions = self.importer.parse_csv(self.csv_path)
+        
+        self.assertEqual(len(transactions), 12)
+        self.assertEqual(transactions[0], {
+            'date': '2026-02-01',
+            'description': 'Salary - ABC Corp',
+            'amount': 3500.0,
+            'category': 'Salary',
+            'type': 'income'
+        })
+        self.assertEqual(transactions[1]['type'], 'expense')
+        self.assertEqual(transactions[1]['amount'], 125.5)
+    
+    def test_import_transactions(self):
+        # Test importing the sample CSV into the database
+        count = self.importer.import_transactions(self.csv_path)
+        
+        self.assertEqual(count, 12)
+        self.assertEqual(len(self.db.get_transactions()), 12)
+    
+    def test_import_rebuilding_indexes(self):
+        # Test that a bulk insert with index rebuild keeps the indexes
+        rows = [(t['date'], t['description'], t['amount'], t['category'], t['type'])
+                for t in self.importer.parse_csv(self.csv_path)]
+        
+        count = self.db.add_transactions_bulk(iter(rows), rebuild_indexes=True)
+        
+        self.db.cursor.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'transactions'"
+        )
+        index_names = {row[0] for row in self.db.cursor.fetchall()}
+        self.assertEqual(count, 12)
+        for name, _ in FinanceDatabase.TRANSACTION_INDEXES:
+            self.assertIn(name, index_names)
+    
+    def test_invalid_rows_skipped(self):
+        # Test that rows with bad dates or amounts are skipped
+        bad_csv = os.path.join(self.tmp_dir, 'bad.csv')
+        with open(bad_csv, 'w', newline='', encoding='utf-8') as f:
+            f.write("Date,Description,Amount\n")
+            f.write("not a date,Coffee,-3.50\n")
+            f.write("2026-02-02,Coffee,abc\n")
+            f.write("02/03/2026,Starbucks,($4.25)\n")
+        
+        output = io.StringIO()
+        with redirect_stdout(output):
+            transactions = self.importer.parse_csv(bad_csv)
+        
+        self.assertEqual(output.getvalue(), (
+            "Skipped 2 invalid rows:\n"
+            "  line 2: invalid date: not a date\n"
+            "  line 3: invalid amount: abc\n"
+        ))
+        self.assertEqual(len(transactions), 1)
+        self.assertEqual(transactions[0]['date'], '2026-02-03')
+        self.assertEqual(transactions[0]['amount'], 4.25)
+        self.assertEqual(transactions[0]['category'], 'Food & Dining')
+    
+    def test_parse_amount_unicode_padding(self):
+        # Test parenthesised amounts padded with non-breaking or thin spaces
+        self.assertEqual(self.importer._parse_amount('(45.00)\xa0'), -45.0)
+        self.assertEqual(self.importer._parse_amount('\u2009(12.00)'), -12.0)
+        self.assertEqual(self.importer._parse_amount('\xa0$(1,250.50)\u2009'), -1250.5)
+    
+    def test_dates_parse_independently_of_row_order(self):
+        # Test that the same date string always parses the same way
+        dates_csv = os.path.join(self.tmp_dir, 'dates.csv')
+        with open(dates_csv, 'w', newline='', encoding='utf-8') as f:
+            f.write("Date,Description,Amount\n")
+            f.write("02/03/2026,Gas Station,-40.00\n")
+            f.write("25/01/2026,Grocery Store,-20.00\n")
+            f.write("03/02/2026,Pharmacy,-15.00\n")
+            f.write("02/03/2026,Gas Station,-40.00\n")
+        
+        transactions = self.importer.parse_csv(dates_csv)
+        
+        self.assertEqual([t['date'] for t in transactions],
+                         ['2026-02-03', '2026-01-25', '2026-03-02', '2026-02-03'])
+        
+        # Earlier calls do not influence how later dates are read
+        importer = CSVImporter(self.db)
+        before = importer._parse_date('02/03/2026')
+        importer._parse_date('25/01/2026')
+        self.assertEqual(importer._parse_date('02/03/2026'), before)
+        self.assertEqual(before, '2026-02-03')
+    
+    def test_short_and_blank_rows_skipped(self):
+        # Test that short rows are skipped and blank lines ignored
+        short_csv = os.path.join(self.tmp_dir, 'short.csv')
+        with open(short_csv, 'w', newline='', encoding='utf-8') as f:
+            f.write("2026-02-01,Grocery Store,-20.00\n")
+            f.write("\n")
+            f.write("2026-02-02,Gas Station\n")
+        
+        output = io.StringIO()
+        with redirect_stdout(output):
+            count = self.importer.import_transactions(short_csv, skip_header=False)
+        
+        self.assertEqual(count, 1)
+        self.assertIn("line 3: missing columns", output.getvalue())
+        
+        with open(short_csv, 'w', newline='', encoding='utf-8') as f:
+            f.write("Date,Description,Amount\n")
+            f.write("2026-02-03\n")
+        
+        self.assertEqual(self.importer.parse_csv(short_csv), [])
+    
+    def test_failed_import_is_rolled_back(self):
+        # Test that an import failing part-way leaves no partial rows behind
+        broken_csv = os.path.join(self.tmp_dir, 'broken.csv')
+        with open(broken_csv, 'w', newline='', encoding='utf-8') as f:
+            f.write("Date,Description,Amount\n")
+            f.write("2026-02-01,Grocery Store,-20.00\n")
+            f.write("2026-02-02," + "x" * (csv.field_size_limit() + 1) + ",-5.00\n")
+        
+        output = io.StringIO()
+        with redirect_stdout(output):
+            count = self.importer.import_transactions(broken_csv)
+        
+        self.assertIsNone(count)
+        self.assertIn("line 3:", output.getvalue())
+        self.assertEqual(self.db.get_transactions(), [])
+        
+        with redirect_stdout(io.StringIO()):
+            missing = self.importer.import_transactions(os.path.join(self.tmp_dir, 'none.csv'))
+        self.assertIsNone(missing)
+
+
+if __name__ == '__main__':
+    unittest.main()
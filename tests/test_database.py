@@ -0,0 +1,162 @@
+"""
+Unit tests for the database module
+Run with: python -m pytest tests/
+"""
+
+import unittest
+import sys
+import os
+import shutil
+import tempfile
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from src.database import FinanceDatabase
+
+
+class TestFinanceDatabase(unittest.TestCase):
+    # Test cases for database operations
+    
+    def setUp(self):
+        # Set up a fresh database in a temporary directory
+        self.tmp_dir = tempfile.mkdtemp()
+        self.db = FinanceDatabase(os.path.join(self.tmp_dir, 'finance.db'))
+    
+    def tearDown(self):
+        # Close the connection and remove the temporary directory
+        self.db.close()
+        shutil.rmtree(self.tmp_dir)
+    
+    def test_add_transactions_bulk(self):
+        # Test inserting several transactions in one batch
+        rows = [
+            ('2026-02-01', 'Salary - ABC Corp', 3500.0, 'Salary', 'income'),
+            ('2026-02-02', 'Grocery Store', 125.5, 'Food & Dining', 'expense'),
+            ('2026-02-03', 'Gas Station', 45.0, 'Transportation', 'expense')
+        ]
+        
+        count = self.db.add_transactions_bulk(rows)
+        
+        self.assertEqual(count, 3)
+        self.assertEqual(len(self.db.get_transactions()), 3)
+    
+    def test_monthly_summary(self):
+        # Test income/expense totals for a month
+        self.db.add_transaction('2026-02-01', 'Salary', 3000, 'Salary', 'income')
+        self.db.add_transaction('2026-02-10', 'Grocery', 200, 'Food & Dining', 'expense')
+        self.db.add_transaction('2026-03-01', 'Grocery', 50, 'Food & Dining', 'expense')
+        
+        summary = self.db.get_monthly_summary(2026, 2)
+        
+        self.assertEqual(summary['income'], 3000)
+        self.assertEqual(summary['expenses'], 200)
+        self.assertEqual(summary['balance'], 2800)
+    
+    def test_monthly_summaries(self):
+        # Test per-month totals from a single range query
+        self.db.add_transaction('2026-01-15', 'Salary', 3000, 'Salary', 'income')
+        self.db.add_transaction('2026-02-10', 'Grocery', 200, 'Food & Dining', 'expense')
+        self.db.add_transaction('2026-02-20', 'Freelance', 500, 'Freelance', 'income')
+        self.db.add_transaction('2026-03-01', 'Grocery', 50, 'Food & Dining', 'expense')
+        
+        summaries = self.db.get_monthly_summaries('2026-01-01', '2026-03-01')
+        
+        self.assertEqual(sorted(summaries), ['2026-01', '2026-02'])
+        self.assertEqual(summaries['2026-01']['income'], 3000)
+        self.assertEqual(summaries['2026-01']['expenses'], 0)
+        self.assertEqual(summaries['2026-02']['balance'], 300)
+        self.assertEqual(summaries['2026-02'], self.db.get_monthly_summary(2026, 2))
+    
+    def test_get_transactions_paging(self):
+        # Test that limit/offset page through newest-first results
+        rows = [(f'2026-02-{day:02d}', f'Purchase {day}', 10.0, 'Shopping', 'expense')
+                for day in range(1, 6)]
+        self.db.add_transactions_bulk(rows)
+        
+        first_page = self.db.get_transactions(limit=2)
+        second_page = self.db.get_transactions(limit=2, offset=2)
+        
+        self.assertEqual([t[1] for t in first_page], ['2026-02-05', '2026-02-04'])
+        self.assertEqual([t[1] for t in second_page], ['2026-02-03', '2026-02-02'])
+        self.assertEqual(len(self.db.get_transactions()), 5)
+    
+    def test_categories_cache_invalidated_on_budget_update(self):
+        # Test that a budget change is visible through get_categories
+        before = dict(self.db.get_categories('expense'))
+        self.db.update_budget_limit('Shopping', 750)
+        after = dict(self.db.get_categories('expense'))
+        
+        self.assertEqual(before['Shopping'], 300)
+        self.assertEqual(after['Shopping'], 750)
+    
+    def test_iter_transactions_matches_get_transactions(self):
+        # Test that streaming yields the same rows as the list query
+        rows = [(f'2026-02-{day:02d}', f'Purchase {day}', 10.0, 'Shopping', 'expense')
+                for day in range(1, 8)]
+        self.db.add_transactions_bulk(rows)
+        
+        streamed = list(self.db.iter_transactions('2026-02-02', '2026-02-06', batch_size=2))
+        
+        self.assertEqual(streamed, self.db.get_transactions('2026-02-02', '2026-02-06'))
+        self.assertEqual(len(streamed), 5)
+    
+    def test_category_spending_top_n(self):
+        # Test that categories beyond top_n are grouped as 'Other'
+        rows = [
+            ('2026-02-01', 'Rent', 900.0, 'Bills & Utilities', 'expense'),
+            ('2026-02-02', 'Grocery', 300.0, 'Food & Dining', 'expense'),
+            ('2026-02-03', 'Bus', 40.0, 'Transportation', 'expense'),
+            ('2026-02-04', 'Movie', 25.0, 'Entertainment', 'expense')
+        ]
+        self.db.add_transactions_bulk(rows)
+        
+        spending = self.db.get_category_spending('2026-02-01', '2026-02-28', top_n=2)
+        
+        self.assertEqual(spending, [
+            ('Bills & Utilities', 900.0),
+            ('Food & Dining', 300.0),
+            ('Other', 65.0)
+        ])
+        self.assertEqual(len(self.db.get_category_spending('2026-02-01', '2026-02-28')), 4)
+        self.assertEqual(len(self.db.get_category_spending('2026-02-01', '2026-02-28', top_n=5)), 4)
+    
+    def test_delete_transactions(self):
+        # Test deleting several transactions in one call
+        rows = [(f'2026-02-{day:02d}', f'Purchase {day}', 10.0, 'Shopping', 'expense')
+                for day in range(1, 6)]
+        self.db.add_transactions_bulk(rows)
+        ids = [t[0] for t in self.db.get_transactions()]
+        
+        deleted = self.db.delete_transactions(ids[:3] + [9999])
+        
+        self.assertEqual(deleted, 3)
+        self.assertEqual([t[0] for t in self.db.get_transactions()], ids[3:])
+        self.assertEqual(self.db.delete_transactions([]), 0)
+    
+    def test_period_totals(self):
+        # Test income/expense totals over an inclusive date range
+        self.db.add_transaction('2026-02-01', 'Salary', 3000, 'Salary', 'income')
+        self.db.add_transaction('2026-02-10', 'Grocery', 200, 'Food & Dining', 'expense')
+        self.db.add_transaction('2026-02-28', 'Dinner', 80, 'Food & Dining', 'expense')
+        self.db.add_transaction('2026-03-01', 'Grocery', 50, 'Food & Dining', 'expense')
+        
+        self.assertEqual(self.db.get_period_totals('2026-02-01', '2026-02-28'), (3000, 280))
+        self.assertEqual(self.db.get_period_totals('2026-04-01', '2026-04-30'), (0, 0))
+    
+    def test_budget_vs_actual(self):
+        # Test budgets joined with spending, including unspent categories
+        self.db.add_transaction('2026-02-05', 'Grocery', 450, 'Food & Dining', 'expense')
+        self.db.add_transaction('2026-02-06', 'Salary', 3000, 'Salary', 'income')
+        self.db.add_transaction('2026-03-01', 'Movie', 20, 'Entertainment', 'expense')
+        
+        rows = self.db.get_budget_vs_actual(2026, 2)
+        
+        self.assertEqual([row[0] for row in rows],
+                         [name for name, limit in self.db.get_categories('expense') if limit > 0])
+        self.assertIn(('Food & Dining', 500, 450), rows)
+        self.assertIn(('Entertainment', 150, 0), rows)
+
+
+if __name__ == '__main__':
+    unittest.main()
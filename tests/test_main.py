@@ -0,0 +1,55 @@
+"""
+Unit tests for the command-line helpers
+Run with: python -m pytest tests/
+"""
+
+import unittest
+import sys
+import os
+
+# Add the project root to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from main import parse_id_list, MAX_DELETE_RANGE
+
+
+class TestParseIdList(unittest.TestCase):
+    # Test cases for parsing transaction ID input
+    
+    def test_single_and_list(self):
+        # Test single IDs and comma-separated lists
+        self.assertEqual(parse_id_list("7"), [7])
+        self.assertEqual(parse_id_list(" 1, 3 ,5 "), [1, 3, 5])
+    
+    def test_ranges(self):
+        # Test inclusive ranges mixed with single IDs
+        self.assertEqual(parse_id_list("10-14"), [10, 11, 12, 13, 14])
+        self.assertEqual(parse_id_list("2, 5 - 6"), [2, 5, 6])
+        self.assertEqual(parse_id_list("4-4"), [4])
+    
+    def test_duplicates_removed_in_order(self):
+        # Test that repeated IDs are kept once, in first-seen order
+        self.assertEqual(parse_id_list("3,1-4,1"), [3, 1, 2, 4])
+    
+    def test_trailing_commas_ignored(self):
+        # Test that empty entries from stray commas are skipped
+        self.assertEqual(parse_id_list("1,2,"), [1, 2])
+        self.assertEqual(parse_id_list(",5,,"), [5])
+    
+    def test_range_limit(self):
+        # Test that ranges may span at most MAX_DELETE_RANGE IDs
+        self.assertEqual(len(parse_id_list(f"1-{MAX_DELETE_RANGE}")), MAX_DELETE_RANGE)
+        with self.assertRaises(ValueError):
+            parse_id_list(f"1-{MAX_DELETE_RANGE + 1}")
+        with self.assertRaises(ValueError):
+            parse_id_list("1-100000000")
+    
+    def test_invalid_input(self):
+        # Test reversed ranges, negative numbers, text and empty input
+        for text in ["5-3", "-5", "-3-5", "3--1", "abc", "1-x", "", " , "]:
+            with self.assertRaises(ValueError, msg=text):
+                parse_id_list(text)
+
+
+if __name__ == '__main__':
+    unittest.main()